@@ -90,12 +90,12 @@ def version_from_profile(profile: ForgeInstallerProfile, version: ForgeVersion)
         overridden_name = forge_lib.name
         if overridden_name.group == "net.minecraftforge":
             if overridden_name.artifact == "minecraftforge":
-                overridden_name.artifact = "forge"
-                overridden_name.version = "%s-%s" % (mc_version, overridden_name.version)
-
-                overridden_name.classifier = "universal"
+                overridden_name = GradleSpecifier(overridden_name.group, "forge",
+                                                  "%s-%s" % (mc_version, overridden_name.version), "universal",
+                                                  overridden_name.extension)
             elif overridden_name.artifact == "forge":
-                overridden_name.classifier = "universal"
+                overridden_name = GradleSpecifier(overridden_name.group, overridden_name.artifact,
+                                                  overridden_name.version, "universal", overridden_name.extension)
 
         overridden_lib = Library(name=overridden_name)
         if forge_lib.url == "http://maven.minecraftforge.net/":
@@ -140,17 +140,16 @@ def version_from_modernized_installer(installer: MojangVersion, version: ForgeVe
 
         if forge_lib.name.group == "net.minecraftforge":
             if forge_lib.name.artifact == "forge":
-                overridden_name = forge_lib.name
-                overridden_name.classifier = "universal"
+                overridden_name = GradleSpecifier(forge_lib.name.group, forge_lib.name.artifact,
+                                                  forge_lib.name.version, "universal", forge_lib.name.extension)
                 forge_lib.downloads.artifact.path = overridden_name.path()
                 forge_lib.downloads.artifact.url = "https://maven.minecraftforge.net/%s" % overridden_name.path()
                 forge_lib.name = overridden_name
 
             elif forge_lib.name.artifact == "minecraftforge":
-                overridden_name = forge_lib.name
-                overridden_name.artifact = "forge"
-                overridden_name.classifier = "universal"
-                overridden_name.version = "%s-%s" % (mc_version, overridden_name.version)
+                overridden_name = GradleSpecifier(forge_lib.name.group, "forge",
+                                                  "%s-%s" % (mc_version, forge_lib.name.version), "universal",
+                                                  forge_lib.name.extension)
                 forge_lib.downloads.artifact.path = overridden_name.path()
                 forge_lib.downloads.artifact.url = "https://maven.minecraftforge.net/%s" % overridden_name.path()
                 forge_lib.name = overridden_name
@@ -229,10 +228,10 @@ def version_from_build_system_installer(installer: MojangVersion, profile: Forge
 
         if forge_lib.name.group == "net.minecraftforge":
             if forge_lib.name.artifact == "forge":
-                forge_lib.name.classifier = "launcher"
+                forge_lib.name = GradleSpecifier(forge_lib.name.group, forge_lib.name.artifact,
+                                                 forge_lib.name.version, "launcher", forge_lib.name.extension)
                 forge_lib.downloads.artifact.path = forge_lib.name.path()
                 forge_lib.downloads.artifact.url = "https://maven.minecraftforge.net/%s" % forge_lib.name.path()
-                forge_lib.name = forge_lib.name
         v.libraries.append(forge_lib)
 
     v.release_time = installer.release_time
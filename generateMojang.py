@@ -302,8 +302,9 @@ def main():
 
             if APPLY_SPLIT_NATIVES_WORKAROUND and lib_is_split_native(lib):
                 # merge classifier into artifact name to workaround bug in launcher
-                specifier.artifact += f"-{specifier.classifier}"
-                specifier.classifier = None
+                specifier = GradleSpecifier(specifier.group, f"{specifier.artifact}-{specifier.classifier}",
+                                            specifier.version, None, specifier.extension)
+                lib.name = specifier
 
             if specifier.is_lwjgl():
                 if has_split_natives:  # implies lwjgl3
@@ -1,5 +1,6 @@
 import hashlib
 import os
+from concurrent.futures import ProcessPoolExecutor
 from operator import attrgetter
 
 from meta.common import launcher_path
@@ -21,14 +22,8 @@ def hash_file(hash_fn, file_name):
 # ignore these files when indexing versions
 ignore = {"index.json", "package.json", "CNAME", ".git", ".github"}
 
-# initialize output structures - package list level
-packages = MetaPackageIndex()
-
-# walk through all the package folders
-for package in sorted(os.listdir(LAUNCHER_DIR)):
-    if package in ignore:
-        continue
 
+def index_package(package):
     sharedData = MetaPackage.parse_file(os.path.join(LAUNCHER_DIR, package, "package.json"))
     recommendedVersions = set()
     if sharedData.recommended:
@@ -59,12 +54,25 @@ for package in sorted(os.listdir(LAUNCHER_DIR)):
     outFilePath = LAUNCHER_DIR + "/%s/index.json" % package
     versionList.write(outFilePath)
 
-    # insert entry into the package index
-    packageEntry = MetaPackageIndexEntry(
+    # return the entry for the package index
+    return MetaPackageIndexEntry(
         uid=package,
         name=sharedData.name,
         sha256=hash_file(hashlib.sha256, outFilePath)
     )
-    packages.packages.append(packageEntry)
 
-packages.write(os.path.join(LAUNCHER_DIR, "index.json"))
+
+def main():
+    # initialize output structures - package list level
+    packages = MetaPackageIndex()
+
+    # walk through all the package folders, each one is indexed independently
+    package_names = [package for package in sorted(os.listdir(LAUNCHER_DIR)) if package not in ignore]
+    with ProcessPoolExecutor() as executor:
+        packages.packages.extend(executor.map(index_package, package_names))
+
+    packages.write(os.path.join(LAUNCHER_DIR, "index.json"))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,14 +1,24 @@
 import copy
+import json
+import sys
 from datetime import datetime
 from typing import Optional, List, Dict, Any, Iterator
 
 import pydantic
 from pydantic import Field, validator
+from pydantic.datetime_parse import parse_datetime
 
-from ..common import serialize_datetime, replace_old_launchermeta_url, get_all_bases, merge_dict
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from ..common import serialize_datetime, deserialize_datetime, replace_old_launchermeta_url, get_all_bases, merge_dict
 
 META_FORMAT_VERSION = 1
 
+LWJGL_GROUPS = frozenset(("org.lwjgl", "org.lwjgl.lwjgl", "net.java.jinput", "net.java.jutils"))
+
 
 class GradleSpecifier:
     """
@@ -18,24 +28,32 @@ class GradleSpecifier:
         "net.minecraft:launchwrapper:1.5"
     """
 
+    __slots__ = ("group", "artifact", "version", "classifier", "extension", "_str", "_path")
+
     def __init__(self, group: str, artifact: str, version: str, classifier: Optional[str] = None,
                  extension: Optional[str] = None):
         if extension is None:
             extension = "jar"
-        self.group = group
-        self.artifact = artifact
-        self.version = version
-        self.classifier = classifier
-        self.extension = extension
+        # the same groups, artifacts and versions repeat across every library list
+        self.group = sys.intern(group)
+        self.artifact = sys.intern(artifact)
+        self.version = sys.intern(version)
+        self.classifier = sys.intern(classifier) if classifier else None
+        self.extension = sys.intern(extension)
+        # renderings are cached, so treat the coordinates as read-only and build a new specifier to change them
+        self._str = None
+        self._path = None
 
     def __str__(self):
-        ext = ''
-        if self.extension != 'jar':
-            ext = "@%s" % self.extension
-        if self.classifier:
-            return "%s:%s:%s:%s%s" % (self.group, self.artifact, self.version, self.classifier, ext)
-        else:
-            return "%s:%s:%s%s" % (self.group, self.artifact, self.version, ext)
+        if self._str is None:
+            ext = ''
+            if self.extension != 'jar':
+                ext = "@%s" % self.extension
+            if self.classifier:
+                self._str = "%s:%s:%s:%s%s" % (self.group, self.artifact, self.version, self.classifier, ext)
+            else:
+                self._str = "%s:%s:%s%s" % (self.group, self.artifact, self.version, ext)
+        return self._str
 
     def filename(self):
         if self.classifier:
@@ -47,19 +65,26 @@ class GradleSpecifier:
         return "%s/%s/%s/" % (self.group.replace('.', '/'), self.artifact, self.version)
 
     def path(self):
-        return self.base() + self.filename()
+        if self._path is None:
+            classifier = "-" + self.classifier if self.classifier else ""
+            self._path = f"{self.group.replace('.', '/')}/{self.artifact}/{self.version}/" \
+                         f"{self.artifact}-{self.version}{classifier}.{self.extension}"
+        return self._path
 
     def __repr__(self):
         return f"GradleSpecifier('{self}')"
 
     def is_lwjgl(self):
-        return self.group in ("org.lwjgl", "org.lwjgl.lwjgl", "net.java.jinput", "net.java.jutils")
+        return self.group in LWJGL_GROUPS
 
     def is_log4j(self):
         return self.group == "org.apache.logging.log4j"
 
     def __eq__(self, other):
-        return str(self) == str(other)
+        if not isinstance(other, GradleSpecifier):
+            return NotImplemented
+        return (self.group, self.artifact, self.version, self.classifier, self.extension) == \
+            (other.group, other.artifact, other.version, other.classifier, other.extension)
 
     def __lt__(self, other):
         return str(self) < str(other)
@@ -68,7 +93,7 @@ class GradleSpecifier:
         return str(self) > str(other)
 
     def __hash__(self):
-        return hash(str(self))
+        return hash((self.group, self.artifact, self.version, self.classifier, self.extension))
 
     @classmethod
     def __get_validators__(cls):
@@ -76,20 +101,17 @@ class GradleSpecifier:
 
     @classmethod
     def from_string(cls, v: str):
-        ext_split = v.split('@')
-
-        components = ext_split[0].split(':')
-        group = components[0]
-        artifact = components[1]
-        version = components[2]
-
-        extension = None
-        if len(ext_split) == 2:
-            extension = ext_split[1]
-
-        classifier = None
-        if len(components) == 4:
-            classifier = components[3]
+        coordinate, sep, extension = v.partition('@')
+        if not sep:
+            extension = None
+
+        group, _, rest = coordinate.partition(':')
+        artifact, _, rest = rest.partition(':')
+        version, sep, classifier = rest.partition(':')
+        if not (group and artifact and version):
+            raise ValueError(f"Invalid gradle specifier: {v}")
+        if not sep:
+            classifier = None
         return cls(group, artifact, version, classifier, extension)
 
     @classmethod
@@ -101,6 +123,27 @@ class GradleSpecifier:
         raise TypeError("Invalid type")
 
 
+class ISOTimestamp(datetime):
+    """
+        An ISO 8601 timestamp. Like one of these:
+        "2017-02-08T13:16:29+00:00"
+        "2010-04-20T00:00:00"
+        Validates into a plain datetime.
+    """
+
+    @classmethod
+    def __get_validators__(cls):
+        yield cls.validate
+
+    @classmethod
+    def validate(cls, v):
+        if isinstance(v, datetime):
+            return v
+        if isinstance(v, str):
+            return deserialize_datetime(v)
+        return parse_datetime(v)
+
+
 class MetaBase(pydantic.BaseModel):
     def dict(self, **kwargs) -> Dict[str, Any]:
         for k in ["by_alias"]:
@@ -116,6 +159,15 @@ class MetaBase(pydantic.BaseModel):
 
         return super(MetaBase, self).json(exclude_none=True, sort_keys=True, by_alias=True, indent=4, **kwargs)
 
+    @classmethod
+    def parse_file(cls, path, **kwargs):
+        if orjson is None or kwargs:
+            return super(MetaBase, cls).parse_file(path, **kwargs)
+
+        # pydantic decodes the file to str before calling json_loads; orjson parses the raw bytes directly
+        with open(path, "rb") as f:
+            return cls.parse_obj(orjson.loads(f.read()))
+
     def write(self, file_path):
         with open(file_path, "w") as f:
             f.write(self.json())
@@ -157,6 +209,9 @@ class MetaBase(pydantic.BaseModel):
     class Config:
         allow_population_by_field_name = True
 
+        # orjson is only used for reading: it cannot emit the 4-space indentation our output files use
+        json_loads = orjson.loads if orjson is not None else json.loads
+
         json_encoders = {
             datetime: serialize_datetime,
             GradleSpecifier: str
@@ -279,7 +334,7 @@ class MetaVersion(Versioned):
     main_class: Optional[str] = Field(alias="mainClass")
     applet_class: Optional[str] = Field(alias="appletClass")
     minecraft_arguments: Optional[str] = Field(alias="minecraftArguments")
-    release_time: Optional[datetime] = Field(alias="releaseTime")
+    release_time: Optional[ISOTimestamp] = Field(alias="releaseTime")
     compatible_java_majors: Optional[List[int]] = Field(alias="compatibleJavaMajors")
     additional_traits: Optional[List[str]] = Field(alias="+traits")
     additional_tweakers: Optional[List[str]] = Field(alias="+tweakers")
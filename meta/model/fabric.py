@@ -1,9 +1,8 @@
-from datetime import datetime
 from typing import Optional, List, Union
 
 from pydantic import Field
 
-from . import Library, MetaBase
+from . import Library, MetaBase, ISOTimestamp
 
 
 class FabricInstallerArguments(MetaBase):
@@ -37,4 +36,4 @@ class FabricInstallerDataV1(MetaBase):
 
 
 class FabricJarInfo(MetaBase):
-    release_time: Optional[datetime] = Field(alias="releaseTime")
+    release_time: Optional[ISOTimestamp] = Field(alias="releaseTime")
@@ -1,9 +1,8 @@
-from datetime import datetime
 from typing import Optional, List, Dict
 
 from pydantic import Field
 
-from . import MetaBase, GradleSpecifier, MojangLibrary
+from . import MetaBase, GradleSpecifier, MojangLibrary, ISOTimestamp
 from .mojang import MojangVersion
 
 
@@ -134,7 +133,7 @@ class ForgeInstallerProfile(MetaBase):
 
 
 class ForgeLegacyInfo(MetaBase):
-    release_time: Optional[datetime] = Field(alias="releaseTime")
+    release_time: Optional[ISOTimestamp] = Field(alias="releaseTime")
     size: Optional[int]
     sha256: Optional[str]
     sha1: Optional[str]
@@ -1,15 +1,14 @@
-from datetime import datetime
 from typing import Optional, List
 
 from pydantic import Field
 
-from meta.model import Dependency, MetaBase, Versioned, MetaVersion
+from meta.model import Dependency, MetaBase, Versioned, MetaVersion, ISOTimestamp
 
 
 class MetaVersionIndexEntry(MetaBase):
     version: str
     type: Optional[str]
-    release_time: datetime = Field(alias="releaseTime")
+    release_time: ISOTimestamp = Field(alias="releaseTime")
     requires: Optional[List[Dependency]]
     conflicts: Optional[List[Dependency]]
     recommended: Optional[bool]
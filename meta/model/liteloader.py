@@ -1,9 +1,8 @@
-from datetime import datetime
 from typing import Optional, List, Dict, Any
 
 from pydantic import Field
 
-from . import Library, MetaBase
+from . import Library, MetaBase, ISOTimestamp
 
 
 class LiteloaderDev(MetaBase):
@@ -99,7 +98,7 @@ class LiteloaderMeta(MetaBase):
     description: str
     authors: str
     url: str
-    updated: datetime
+    updated: ISOTimestamp
     updated_time: int = Field(alias="updatedTime")
 
 
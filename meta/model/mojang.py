@@ -1,10 +1,9 @@
-from datetime import datetime
 from typing import Optional, List, Dict, Any, Iterator
 
 from pydantic import validator, Field
 
 from . import MetaBase, MojangArtifactBase, MojangAssets, MojangLibrary, MojangArtifact, MojangLibraryDownloads, \
-    Library, MetaVersion, GradleSpecifier
+    Library, MetaVersion, GradleSpecifier, ISOTimestamp
 
 SUPPORTED_LAUNCHER_VERSION = 21
 SUPPORTED_COMPLIANCE_LEVEL = 1
@@ -42,8 +41,8 @@ class MojangLatestVersion(MetaBase):
 
 class MojangIndexEntry(MetaBase):
     id: Optional[str]
-    release_time: Optional[datetime] = Field(alias="releaseTime")
-    time: Optional[datetime]
+    release_time: Optional[ISOTimestamp] = Field(alias="releaseTime")
+    time: Optional[ISOTimestamp]
     type: Optional[str]
     url: Optional[str]
     sha1: Optional[str]
@@ -100,7 +99,7 @@ class OldSnapshotIndexWrap:
 class LegacyOverrideEntry(MetaBase):
     main_class: Optional[str] = Field(alias="mainClass")
     applet_class: Optional[str] = Field(alias="appletClass")
-    release_time: Optional[datetime] = Field(alias="releaseTime")
+    release_time: Optional[ISOTimestamp] = Field(alias="releaseTime")
     additional_traits: Optional[List[str]] = Field(alias="+traits")
     additional_jvm_args: Optional[List[str]] = Field(alias="+jvmArgs")
 
@@ -180,16 +179,6 @@ class JavaVersion(MetaBase):
 
 
 class MojangVersion(MetaBase):
-    @validator("minimum_launcher_version")
-    def validate_minimum_launcher_version(cls, v):
-        assert v <= SUPPORTED_LAUNCHER_VERSION
-        return v
-
-    @validator("compliance_level")
-    def validate_compliance_level(cls, v):
-        assert v <= SUPPORTED_COMPLIANCE_LEVEL
-        return v
-
     id: str  # TODO: optional?
     arguments: Optional[MojangArguments]
     asset_index: Optional[MojangAssets] = Field(alias="assetIndex")
@@ -201,13 +190,13 @@ class MojangVersion(MetaBase):
     processArguments: Optional[str]
     minecraft_arguments: Optional[str] = Field(alias="minecraftArguments")
     minimum_launcher_version: Optional[int] = Field(
-        alias="minimumLauncherVersion")
-    release_time: Optional[datetime] = Field(alias="releaseTime")
-    time: Optional[datetime]
+        alias="minimumLauncherVersion", le=SUPPORTED_LAUNCHER_VERSION)
+    release_time: Optional[ISOTimestamp] = Field(alias="releaseTime")
+    time: Optional[ISOTimestamp]
     type: Optional[str]
     inherits_from: Optional[str] = Field("inheritsFrom")
     logging: Optional[Dict[str, MojangLogging]]  # TODO improve this?
-    compliance_level: Optional[int] = Field(alias="complianceLevel")
+    compliance_level: Optional[int] = Field(alias="complianceLevel", le=SUPPORTED_COMPLIANCE_LEVEL)
     javaVersion: Optional[JavaVersion]
 
     def to_meta_version(self, name: str, uid: str, version: str) -> MetaVersion: